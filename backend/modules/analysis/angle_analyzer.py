@@ -1,6 +1,10 @@
+import bisect
 import numpy as np
 from ..core.utils import calculate_angle, calculate_angle_with_vertical
 
+# Limites (inclusivos) do ângulo do ombro para as pontuações 1 a 3; acima do último, pontuação 4
+shoulder_angle_thresholds = (20, 45, 90)
+
 class AngleAnalyzer:
     def __init__(self):
         """
@@ -10,7 +14,7 @@ class AngleAnalyzer:
         
     # A função calculate_neck_angle foi removida
     
-    def calculate_spine_angle(self, landmarks, use_vertical_reference=True):
+    def calculate_spine_angle(self, landmarks, use_vertical_reference=True, return_midpoints=False):
         """
         Calcula o ângulo da coluna vertebral usando os pontos médios dos ombros e quadris.
         
@@ -18,9 +22,12 @@ class AngleAnalyzer:
             landmarks (dict): Dicionário com as coordenadas dos landmarks
             use_vertical_reference (bool): Se True, calcula o ângulo em relação à vertical
                                           Se False, calcula o ângulo interno
+            return_midpoints (bool): Se True, devolve também os pontos médios usados no cálculo
             
         Returns:
             float: Ângulo da coluna ou None se não for possível calcular
+            tuple: Com return_midpoints, (ângulo, ponto médio dos ombros, ponto médio dos quadris);
+                   os três são None se não for possível calcular
         """
         # IDs dos landmarks dos ombros
         left_shoulder_id, right_shoulder_id = 11, 12
@@ -31,7 +38,7 @@ class AngleAnalyzer:
         # Verifica se todos os landmarks necessários estão disponíveis
         required_landmarks = [left_shoulder_id, right_shoulder_id, left_hip_id, right_hip_id]
         if not all(lm_id in landmarks for lm_id in required_landmarks):
-            return None
+            return (None, None, None) if return_midpoints else None
         
         # Calcula o ponto médio entre os ombros
         left_shoulder = landmarks[left_shoulder_id]
@@ -51,14 +58,18 @@ class AngleAnalyzer:
         
         if use_vertical_reference:
             # Calcula o ângulo em relação à vertical
-            return calculate_angle_with_vertical(shoulder_midpoint, hip_midpoint)
+            spine_angle = calculate_angle_with_vertical(shoulder_midpoint, hip_midpoint)
         else:
             # Para calcular o ângulo interno, precisamos de um terceiro ponto
             # Vamos criar um ponto acima do ponto médio dos ombros (na mesma vertical)
             vertical_point = (shoulder_midpoint[0], shoulder_midpoint[1] - 100)
             
             # Calcula o ângulo interno
-            return calculate_angle(vertical_point, shoulder_midpoint, hip_midpoint)
+            spine_angle = calculate_angle(vertical_point, shoulder_midpoint, hip_midpoint)
+        
+        if return_midpoints:
+            return spine_angle, shoulder_midpoint, hip_midpoint
+        return spine_angle
     
     def calculate_elbow_angle(self, landmarks, side='right'):
         """
@@ -257,17 +268,9 @@ class AngleAnalyzer:
         if shoulder_angle is None:
             return None, None, False
         
-        # Determina a pontuação com base no ângulo
-        score = 1  # Valor padrão
-        
-        if shoulder_angle <= 20:
-            score = 1  # Verde (0° a 20°)
-        elif shoulder_angle <= 45:
-            score = 2  # Amarelo (>20° a 45°)
-        elif shoulder_angle <= 90:
-            score = 3  # Laranja (>45° a 90°)
-        else:
-            score = 4  # Vermelho (>90°)
+        # Determina a pontuação com base no ângulo: bisect_left devolve a primeira faixa
+        # cujo limite é >= ângulo (1: 0° a 20°, 2: >20° a 45°, 3: >45° a 90°, 4: >90°)
+        score = bisect.bisect_left(shoulder_angle_thresholds, shoulder_angle) + 1
         
         # Verifica se o braço está em abdução (para o lado)
         # Calculamos a diferença horizontal entre o cotovelo e a linha vertical do ombro
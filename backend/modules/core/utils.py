@@ -3,6 +3,7 @@ import cv2
 import numpy as np
 import math
 from datetime import datetime
+from functools import lru_cache
 
 def ensure_directory_exists(directory):
     """
@@ -100,7 +101,26 @@ def prolongar_reta(p1, p2, fator=0):
 # Dicionário global para armazenar as posições dos textos já desenhados no frame atual
 _text_positions = {}
 
-def adjust_text_position(frame, text, position, font, font_scale, color, thickness):
+@lru_cache(maxsize=4096)
+def get_text_size(text, font, font_scale, thickness):
+    """
+    Retorna o tamanho de um texto, reaproveitando medições anteriores.
+    
+    Os rótulos de ângulo se repetem muito ao longo de um vídeo e os parâmetros da
+    fonte são fixos, então a medição do OpenCV é feita uma única vez por texto.
+    
+    Args:
+        text (str): Texto a ser medido
+        font: Fonte do texto
+        font_scale (float): Escala da fonte
+        thickness (int): Espessura do texto
+        
+    Returns:
+        tuple: Largura e altura do texto (w, h)
+    """
+    return cv2.getTextSize(text, font, font_scale, thickness)[0]
+
+def adjust_text_position(frame, text, position, font, font_scale, color, thickness, text_size=None):
     """
     Ajusta a posição do texto para garantir que ele fique dentro dos limites do frame
     e não sobreponha outros textos já desenhados.
@@ -113,6 +133,8 @@ def adjust_text_position(frame, text, position, font, font_scale, color, thickne
         font_scale (float): Escala da fonte
         color (tuple): Cor do texto (B, G, R)
         thickness (int): Espessura do texto
+        text_size (tuple, optional): Tamanho (w, h) do texto já medido pelo chamador.
+                                     Se None, o tamanho é obtido com get_text_size.
         
     Returns:
         tuple: Posição ajustada do texto (x, y)
@@ -125,7 +147,8 @@ def adjust_text_position(frame, text, position, font, font_scale, color, thickne
         _text_positions = {}
         adjust_text_position.last_frame_id = frame_id
     
-    text_size = cv2.getTextSize(text, font, font_scale, thickness)[0]
+    if text_size is None:
+        text_size = get_text_size(text, font, font_scale, thickness)
     text_w, text_h = text_size
     text_x, text_y = position
     
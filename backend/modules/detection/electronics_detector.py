@@ -72,10 +72,18 @@ class ElectronicsDetector:
         Returns:
             numpy.ndarray: Frame com as detecções desenhadas
         """
+        if not detections:
+            return frame
+        
+        # Desenha todas as caixas delimitadoras em uma única chamada
+        # (um contorno fechado pelos 4 cantos com espessura 2 é idêntico ao cv2.rectangle)
+        boxes = np.array([
+            [(x, y), (x + w, y), (x + w, y + h), (x, y + h)]
+            for _, _, (x, y, w, h) in detections
+        ], dtype=np.int32)
+        cv2.polylines(frame, boxes, isClosed=True, color=(0, 255, 0), thickness=2)
+        
         for class_name, confidence, (x, y, w, h) in detections:
-            # Desenha a caixa delimitadora
-            cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
-            
             # Desenha o nome da classe e a confiança
             label = f"{class_name}: {confidence:.2f}"
             cv2.putText(frame, label, (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
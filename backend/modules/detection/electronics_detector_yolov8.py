@@ -126,14 +126,22 @@ class ElectronicsDetectorYOLOv8:
         Returns:
             numpy.ndarray: Frame com as detecções desenhadas
         """
+        if not detections:
+            return frame
+        
+        # Desenha todas as caixas delimitadoras em uma única chamada
+        # (um contorno fechado pelos 4 cantos com espessura 2 é idêntico ao cv2.rectangle)
+        boxes = np.array([
+            [(x1, y1), (x2, y1), (x2, y2), (x1, y2)]
+            for x1, y1, x2, y2 in (detection['bbox'] for detection in detections)
+        ], dtype=np.int32)
+        cv2.polylines(frame, boxes, isClosed=True, color=(0, 255, 0), thickness=2)
+        
         for detection in detections:
             class_name = detection['class']
             confidence = detection['confidence']
             x1, y1, x2, y2 = detection['bbox']
             
-            # Desenha a caixa delimitadora
-            cv2.rectangle(frame, (x1, y1), (x2, y2), (0, 255, 0), 2)
-            
             # Desenha o nome da classe e a confiança
             label = f"{class_name}: {confidence:.2f}"
             cv2.putText(frame, label, (x1, y1 - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
@@ -1,9 +1,12 @@
 import cv2
 import os
+import queue
+import threading
 import time
 import numpy as np
 import mediapipe as mp
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from ..core.utils import ensure_directory_exists, get_timestamp
 from ..detection.pose_detector import PoseDetector
 from ..visualization.video_visualizer import VideoVisualizer
@@ -53,15 +56,24 @@ class VideoProcessor:
             tarja_ratio=0.20,
             tarja_max_size=200
         )
+        
+        # Overlays desenhados em cada frame, montados a partir da configuração (ver _get_frame_overlays).
+        # Configuração e lista ficam na mesma tupla para serem publicadas juntas entre threads
+        self._frame_overlays = (None, [])
     
-    def process_video(self, video_path, output_folder, progress_callback=None):
+    def process_video(self, video_path, output_folder, progress_callback=None, prefetch=8):
         """
         Processa um vídeo.
         
+        A leitura (decodificação) e a escrita (codificação) dos frames rodam em
+        threads separadas, ligadas ao processamento por filas limitadas, de modo
+        que o tempo total se aproxima do estágio mais lento em vez da soma dos três.
+        
         Args:
             video_path (str): Caminho do vídeo a ser processado
             output_folder (str): Pasta onde o vídeo processado será salvo
             progress_callback (callable): Função de callback para reportar o progresso
+            prefetch (int): Número máximo de frames aguardando em cada fila
             
         Returns:
             tuple: (sucesso, caminho do vídeo processado ou mensagem de erro)
@@ -100,36 +112,65 @@ class VideoProcessor:
             fourcc = cv2.VideoWriter_fourcc(*'mp4v')
             out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
             
+            # Filas limitadas entre leitura, processamento e escrita (None sinaliza o fim)
+            read_queue = queue.Queue(maxsize=prefetch)
+            write_queue = queue.Queue(maxsize=prefetch)
+            stop_event = threading.Event()
+            errors = []
+            
+            reader = threading.Thread(
+                target=self._read_frames,
+                args=(cap, read_queue, stop_event, errors),
+                daemon=True
+            )
+            writer = threading.Thread(
+                target=self._write_frames,
+                args=(out, write_queue, errors),
+                daemon=True
+            )
+            reader.start()
+            writer.start()
+            
             # Processa o vídeo
             frame_count = 0
             start_time = time.time()
             
-            while True:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-                
-                # Processa o frame
-                processed_frame = self._process_frame(frame, video_path, output_folder, frame_count)
-                
-                # Escreve o frame processado no vídeo de saída
-                out.write(processed_frame)
-                
-                # Atualiza o contador de frames e o progresso
-                frame_count += 1
-                if progress_callback and total_frames > 0:
-                    progress = (frame_count / total_frames) * 100
-                    elapsed_time = time.time() - start_time
-                    remaining_frames = total_frames - frame_count
+            try:
+                while True:
+                    frame = read_queue.get()
+                    if frame is None:
+                        break
+                    
+                    # Processa o frame
+                    processed_frame = self._process_frame(frame, video_path, output_folder, frame_count)
                     
-                    # Estima o tempo restante
-                    if frame_count > 0 and elapsed_time > 0:
-                        time_per_frame = elapsed_time / frame_count
-                        estimated_time_remaining = remaining_frames * time_per_frame
-                    else:
-                        estimated_time_remaining = 0
+                    # Envia o frame processado para a thread de escrita
+                    write_queue.put(processed_frame)
                     
-                    progress_callback(progress, estimated_time_remaining)
+                    # Atualiza o contador de frames e o progresso
+                    frame_count += 1
+                    if progress_callback and total_frames > 0:
+                        progress = (frame_count / total_frames) * 100
+                        elapsed_time = time.time() - start_time
+                        remaining_frames = total_frames - frame_count
+                        
+                        # Estima o tempo restante
+                        if frame_count > 0 and elapsed_time > 0:
+                            time_per_frame = elapsed_time / frame_count
+                            estimated_time_remaining = remaining_frames * time_per_frame
+                        else:
+                            estimated_time_remaining = 0
+                        
+                        progress_callback(progress, estimated_time_remaining)
+            finally:
+                # Encerra as threads antes de liberar a captura e o writer
+                stop_event.set()
+                write_queue.put(None)
+                reader.join()
+                writer.join()
+            
+            if errors:
+                raise errors[0]
             
             # Libera os recursos
             cap.release()
@@ -147,6 +188,162 @@ class VideoProcessor:
             if 'out' in locals() and out is not None:
                 out.release()
     
+    def process_stream_realtime(self, cap, frame_callback, stop_event=None):
+        """
+        Processa uma fonte de vídeo ao vivo (por exemplo, uma câmera), descartando frames atrasados.
+        
+        A thread de leitura mantém apenas o frame mais recente: se o processamento
+        estiver mais lento que a fonte, o frame pendente é substituído pelo novo.
+        Assim a latência fica limitada a um frame em vez de crescer indefinidamente.
+        
+        Args:
+            cap (cv2.VideoCapture): Fonte de vídeo já aberta
+            frame_callback (callable): Função chamada com cada frame processado
+            stop_event (threading.Event, optional): Permite interromper o processamento externamente
+            
+        Returns:
+            dict: Contadores de frames processados ('processed') e descartados ('dropped')
+        """
+        if stop_event is None:
+            stop_event = threading.Event()
+        
+        latest_queue = queue.Queue(maxsize=1)
+        stats = {'processed': 0, 'dropped': 0}
+        errors = []
+        
+        reader = threading.Thread(
+            target=self._read_latest_frames,
+            args=(cap, latest_queue, stop_event, stats, errors),
+            daemon=True
+        )
+        reader.start()
+        
+        try:
+            while True:
+                frame = latest_queue.get()
+                if frame is None:
+                    break
+                
+                processed_frame = self._process_frame(frame, frame_idx=stats['processed'])
+                frame_callback(processed_frame)
+                stats['processed'] += 1
+        finally:
+            stop_event.set()
+            reader.join()
+        
+        if errors:
+            raise errors[0]
+        
+        return stats
+    
+    def _read_latest_frames(self, cap, latest_queue, stop_event, stats, errors):
+        """
+        Lê frames continuamente, mantendo na fila apenas o mais recente (executado em thread própria).
+        
+        Args:
+            cap (cv2.VideoCapture): Fonte de vídeo
+            latest_queue (queue.Queue): Fila de uma posição com o frame mais recente
+            stop_event (threading.Event): Sinaliza que o processamento foi interrompido
+            stats (dict): Contadores do processamento ('dropped' é atualizado aqui)
+            errors (list): Lista onde exceções da thread são registradas
+        """
+        try:
+            while not stop_event.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                
+                try:
+                    latest_queue.put_nowait(frame)
+                except queue.Full:
+                    # Descarta o frame ainda não processado e guarda o mais recente
+                    try:
+                        latest_queue.get_nowait()
+                        stats['dropped'] += 1
+                    except queue.Empty:
+                        pass
+                    latest_queue.put_nowait(frame)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            # Sinaliza o fim da fonte depois que o último frame for consumido
+            if not self._put_until_stopped(latest_queue, None, stop_event):
+                # Interrompido: o sinal de fim precisa chegar mesmo assim, senão o consumidor
+                # fica bloqueado na fila. Descarta o frame pendente para abrir espaço
+                # (só esta thread coloca itens na fila, então a inserção não falha)
+                try:
+                    latest_queue.get_nowait()
+                    stats['dropped'] += 1
+                except queue.Empty:
+                    pass
+                latest_queue.put_nowait(None)
+    
+    def _read_frames(self, cap, read_queue, stop_event, errors):
+        """
+        Lê os frames do vídeo e os coloca na fila de leitura (executado em thread própria).
+        
+        Args:
+            cap (cv2.VideoCapture): Vídeo de entrada
+            read_queue (queue.Queue): Fila de frames lidos
+            stop_event (threading.Event): Sinaliza que o processamento foi interrompido
+            errors (list): Lista onde exceções da thread são registradas
+        """
+        try:
+            while not stop_event.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                
+                self._put_until_stopped(read_queue, frame, stop_event)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            # Sinaliza o fim da leitura
+            self._put_until_stopped(read_queue, None, stop_event)
+    
+    def _put_until_stopped(self, target_queue, item, stop_event):
+        """
+        Coloca um item na fila, esperando por espaço enquanto o processamento não for interrompido.
+        
+        Args:
+            target_queue (queue.Queue): Fila de destino
+            item: Item a ser colocado na fila
+            stop_event (threading.Event): Sinaliza que o processamento foi interrompido
+            
+        Returns:
+            bool: True se o item foi colocado na fila
+        """
+        while not stop_event.is_set():
+            try:
+                target_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _write_frames(self, out, write_queue, errors):
+        """
+        Escreve no vídeo de saída os frames da fila de escrita (executado em thread própria).
+        
+        Args:
+            out (cv2.VideoWriter): Vídeo de saída
+            write_queue (queue.Queue): Fila de frames processados
+            errors (list): Lista onde exceções da thread são registradas
+        """
+        while True:
+            frame = write_queue.get()
+            if frame is None:
+                break
+            
+            # Após um erro, continua consumindo a fila para não bloquear o processamento
+            if errors:
+                continue
+            
+            try:
+                out.write(frame)
+            except Exception as e:
+                errors.append(e)
+    
     def process_video_parallel(self, video_path, output_folder, num_workers=4, progress_callback=None):
         """
         Processa um vídeo usando processamento paralelo.
@@ -342,84 +539,121 @@ class VideoProcessor:
                     show_upper_body=self.config.get('show_upper_body', True),
                     show_lower_body=self.config.get('show_lower_body', True)
                 )
-                
-                # Calcula e desenha o ângulo do pescoço se a opção estiver habilitada
-                if self.config.get('show_angles', True) and self.config.get('show_upper_body', True):
-                    # Calcula e desenha o ângulo do braço superior (ombro) para ambos os lados
-                    # Verifica se temos landmarks suficientes para calcular o ângulo do ombro direito
-                    right_shoulder_landmarks_available = all(lm_id in pose_landmarks for lm_id in [12, 14, 11])
-                    
-                    if right_shoulder_landmarks_available:
-                        # Desenha o ângulo do ombro direito
-                        frame, right_shoulder_angle, right_shoulder_score = self.video_visualizer.draw_shoulder_angle(
-                            frame,
-                            pose_landmarks,
-                            side='right'
-                        )
-                    
-                    # Verifica se temos landmarks suficientes para calcular o ângulo do ombro esquerdo
-                    left_shoulder_landmarks_available = all(lm_id in pose_landmarks for lm_id in [11, 13, 12])
-                    
-                    if left_shoulder_landmarks_available:
-                        # Desenha o ângulo do ombro esquerdo
-                        frame, left_shoulder_angle, left_shoulder_score = self.video_visualizer.draw_shoulder_angle(
-                            frame,
-                            pose_landmarks,
-                            side='left'
-                        )
-                    
-                    # Verifica se temos landmarks suficientes para calcular o ângulo do antebraço direito
-                    right_forearm_landmarks_available = all(lm_id in pose_landmarks for lm_id in [12, 14, 16])
-                    
-                    if right_forearm_landmarks_available:
-                        # Desenha o ângulo do antebraço direito
-                        frame, right_forearm_angle, right_forearm_score = self.video_visualizer.draw_forearm_angle(
-                            frame,
-                            pose_landmarks,
-                            side='right'
-                        )
-                    
-                    # Verifica se temos landmarks suficientes para calcular o ângulo do antebraço esquerdo
-                    left_forearm_landmarks_available = all(lm_id in pose_landmarks for lm_id in [11, 13, 15])
-                    
-                    if left_forearm_landmarks_available:
-                        # Desenha o ângulo do antebraço esquerdo
-                        frame, left_forearm_angle, left_forearm_score = self.video_visualizer.draw_forearm_angle(
-                            frame,
-                            pose_landmarks,
-                            side='left'
-                        )
-                    
-            # Desenha landmarks de pose básicos se habilitado (modo debug)
-            if self.config.get('show_pose_landmarks', False) and results.pose_landmarks:
-                self.mp_drawing.draw_landmarks(
-                    frame,
-                    results.pose_landmarks,
-                    self.mp_pose.POSE_CONNECTIONS,
-                    self.mp_drawing.DrawingSpec(color=(255, 255, 0), thickness=2, circle_radius=2),
-                    self.mp_drawing.DrawingSpec(color=(255, 255, 255), thickness=2, circle_radius=2)
-                )
-                    
-            # A visualização do ângulo do pescoço foi removida
             
-            # Calcula e desenha o ângulo da coluna vertebral se a opção estiver habilitada
-            if self.config.get('show_angles', True) and self.config.get('show_upper_body', True) and self.config.get('show_lower_body', True):
-                # Verifica se temos landmarks suficientes para calcular o ângulo da coluna
-                spine_landmarks_available = all(lm_id in pose_landmarks for lm_id in [11, 12, 23, 24])
-                
-                if spine_landmarks_available:
-                    # Desenha o ângulo da coluna (usa referência vertical por padrão)
-                    frame, spine_angle = self.video_visualizer.draw_spine_angle(
-                        frame,
-                        pose_landmarks,
-                        use_vertical_reference=True
-                    )
+            # Desenha os overlays habilitados (ângulos e landmarks de depuração), na ordem da configuração
+            for overlay in self._get_frame_overlays():
+                frame = overlay(frame, results, pose_landmarks)
             
             return frame
             
         except Exception as e:
             print(f"Erro ao processar frame {frame_idx}: {str(e)}")
-            return frame  # Retorna o frame original em caso de erro
+            # A tarja e os landmarks são desenhados no próprio frame: se a falha ocorrer
+            # no meio do desenho, o frame volta parcialmente desenhado, não o original
+            return frame
+    
+    def _get_frame_overlays(self):
+        """
+        Retorna os overlays desenhados em cada frame, remontando a lista só quando a configuração muda.
+        
+        Returns:
+            list: Funções overlay(frame, results, pose_landmarks) -> frame, na ordem de desenho
+        """
+        overlay_config = (
+            self.config.get('show_angles', True),
+            self.config.get('show_upper_body', True),
+            self.config.get('show_lower_body', True),
+            self.config.get('show_pose_landmarks', False)
+        )
+        
+        cached_config, overlays = self._frame_overlays
+        if cached_config != overlay_config:
+            # Monta a lista antes de publicá-la: com process_video_parallel vários workers
+            # chamam este método ao mesmo tempo e nenhum pode ver a configuração nova com a lista antiga
+            overlays = self._build_frame_overlays(*overlay_config)
+            self._frame_overlays = (overlay_config, overlays)
+        
+        return overlays
+    
+    def _build_frame_overlays(self, show_angles, show_upper_body, show_lower_body, show_pose_landmarks):
+        """
+        Monta a lista de overlays habilitados pela configuração.
+        
+        Args:
+            show_angles (bool): Se deve desenhar os ângulos
+            show_upper_body (bool): Se o corpo superior é exibido
+            show_lower_body (bool): Se o corpo inferior é exibido
+            show_pose_landmarks (bool): Se deve desenhar os landmarks do MediaPipe (modo debug)
+            
+        Returns:
+            list: Funções overlay(frame, results, pose_landmarks) -> frame
+        """
+        visualizer = self.video_visualizer
+        overlays = []
+        
+        # Ângulos dos ombros e antebraços (corpo superior)
+        if show_angles and show_upper_body:
+            overlays += [
+                partial(self._draw_angle_overlay, visualizer.draw_shoulder_angle, (12, 14, 11), side='right'),
+                partial(self._draw_angle_overlay, visualizer.draw_shoulder_angle, (11, 13, 12), side='left'),
+                partial(self._draw_angle_overlay, visualizer.draw_forearm_angle, (12, 14, 16), side='right'),
+                partial(self._draw_angle_overlay, visualizer.draw_forearm_angle, (11, 13, 15), side='left')
+            ]
+        
+        # Landmarks de pose básicos (modo debug)
+        if show_pose_landmarks:
+            overlays.append(self._draw_debug_pose_landmarks)
+        
+        # A visualização do ângulo do pescoço foi removida
+        
+        # Ângulo da coluna vertebral (usa referência vertical por padrão)
+        if show_angles and show_upper_body and show_lower_body:
+            overlays.append(
+                partial(self._draw_angle_overlay, visualizer.draw_spine_angle, (11, 12, 23, 24), use_vertical_reference=True)
+            )
+        
+        return overlays
+    
+    def _draw_angle_overlay(self, draw, required_landmarks, frame, results, pose_landmarks, **kwargs):
+        """
+        Desenha um ângulo se todos os landmarks necessários estiverem disponíveis.
+        
+        Args:
+            draw (callable): Método de desenho do VideoVisualizer (retorna o frame como primeiro item)
+            required_landmarks (tuple): IDs dos landmarks necessários para o cálculo
+            frame (numpy.ndarray): Frame onde desenhar
+            results: Resultados do MediaPipe
+            pose_landmarks (dict): Landmarks da pose em coordenadas de pixel
+            **kwargs: Argumentos adicionais do método de desenho (por exemplo, side)
+            
+        Returns:
+            numpy.ndarray: Frame com o ângulo desenhado
+        """
+        if all(lm_id in pose_landmarks for lm_id in required_landmarks):
+            frame = draw(frame, pose_landmarks, **kwargs)[0]
+        return frame
+    
+    def _draw_debug_pose_landmarks(self, frame, results, pose_landmarks):
+        """
+        Desenha os landmarks de pose do MediaPipe (modo debug).
+        
+        Args:
+            frame (numpy.ndarray): Frame onde desenhar
+            results: Resultados do MediaPipe
+            pose_landmarks (dict): Landmarks da pose em coordenadas de pixel
+            
+        Returns:
+            numpy.ndarray: Frame com os landmarks desenhados
+        """
+        if results.pose_landmarks:
+            self.mp_drawing.draw_landmarks(
+                frame,
+                results.pose_landmarks,
+                self.mp_pose.POSE_CONNECTIONS,
+                self.mp_drawing.DrawingSpec(color=(255, 255, 0), thickness=2, circle_radius=2),
+                self.mp_drawing.DrawingSpec(color=(255, 255, 255), thickness=2, circle_radius=2)
+            )
+        return frame
     
     def _get_face_landmarks_with_fallback(self, results, width, height, pose_landmarks):
         """
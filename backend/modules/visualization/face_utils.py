@@ -1,6 +1,58 @@
 import cv2
 import numpy as np
 
+def points_array(landmarks, dtype=np.int64):
+    """
+    Converte os valores de um dicionário de landmarks {id: (x, y)} em um array.
+    
+    Args:
+        landmarks (dict): Dicionário com coordenadas (x, y) em pixel
+        dtype (numpy.dtype): Tipo inteiro do array (padrão: int64)
+        
+    Returns:
+        numpy.ndarray: Array (N, 2) com as coordenadas
+    """
+    return np.fromiter(
+        (value for point in landmarks.values() for value in point),
+        dtype=dtype,
+        count=2 * len(landmarks)
+    ).reshape(-1, 2)
+
+def fill_black_rect(frame, x_min, y_min, x_max, y_max):
+    """
+    Pinta de preto um retângulo por atribuição direta na fatia do frame.
+    
+    Equivale a cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), (0, 0, 0), -1):
+    os cantos são inclusivos, podem vir em qualquer ordem e o retângulo é
+    recortado aos limites do frame.
+    
+    Args:
+        frame (numpy.ndarray): Frame a ser pintado (modificado no lugar)
+        x_min (int): Coordenada x de um dos cantos
+        y_min (int): Coordenada y de um dos cantos
+        x_max (int): Coordenada x do canto oposto
+        y_max (int): Coordenada y do canto oposto
+    """
+    height, width = frame.shape[:2]
+    x0, x1 = max(min(x_min, x_max), 0), min(max(x_min, x_max), width - 1)
+    y0, y1 = max(min(y_min, y_max), 0), min(max(y_min, y_max), height - 1)
+    
+    if x0 <= x1 and y0 <= y1:
+        frame[y0:y1 + 1, x0:x1 + 1] = 0
+
+def single_eye_tarja_size(frame_width, tarja_max_size):
+    """
+    Tamanho da tarja quando só um olho é visível (depende apenas da largura do frame).
+    
+    Args:
+        frame_width (int): Largura do frame
+        tarja_max_size (int): Tamanho máximo da tarja em pixels
+        
+    Returns:
+        int: Tamanho da tarja em pixels (15% da largura, entre 100px e o máximo configurado)
+    """
+    return max(100, min(int(frame_width * 0.15), tarja_max_size))  # Usa 15% da largura do frame
+
 class FaceUtils:
     """
     Classe utilitária para operações relacionadas ao rosto, como aplicação de tarja.
@@ -21,6 +73,7 @@ class FaceUtils:
         """
         Aplica tarja no rosto usando landmarks faciais ou dos olhos.
         Tenta aplicar uma tarja oval baseada no face_mesh, com fallback para tarja quadrada.
+        A tarja é desenhada diretamente no frame recebido, sem cópias por frame.
         
         Args:
             frame (numpy.ndarray): Frame onde a tarja será aplicada
@@ -28,7 +81,7 @@ class FaceUtils:
             eye_landmarks (dict): Dicionário com os landmarks dos olhos (fallback)
             
         Returns:
-            numpy.ndarray: Frame com a tarja aplicada
+            numpy.ndarray: Frame com a tarja aplicada (o próprio frame, modificado no lugar)
         """
         try:
             if face_landmarks and len(face_landmarks) > 5:
@@ -54,7 +107,7 @@ class FaceUtils:
             landmarks (dict): Dicionário com landmarks faciais ou dos olhos
             
         Returns:
-            numpy.ndarray: Frame com tarja quadrada aplicada
+            numpy.ndarray: Frame com tarja quadrada aplicada (o próprio frame, modificado no lugar)
         """
         if not landmarks:
             return frame
@@ -82,23 +135,17 @@ class FaceUtils:
         elif left_eye or right_eye:
             # Se tiver apenas um olho, usa um tamanho padrão menor
             center_x, center_y = left_eye if left_eye else right_eye
-            tarja_size = max(100, min(int(w * 0.15), self.tarja_max_size))  # Usa 15% da largura do frame
+            tarja_size = single_eye_tarja_size(w, self.tarja_max_size)
         else:
             # Tenta usar outros landmarks faciais disponíveis
-            available_landmarks = [(x, y) for x, y in landmarks.values() if x > 0 and y > 0]
-            if not available_landmarks:
+            points = points_array(landmarks)
+            points = points[(points > 0).all(axis=1)]
+            if not len(points):
                 return frame
             
             # Calcula o centro e estima o tamanho com base na dispersão dos landmarks
-            center_x = sum(x for x, y in available_landmarks) // len(available_landmarks)
-            center_y = sum(y for x, y in available_landmarks) // len(available_landmarks)
-            
-            # Calcula a dispersão dos landmarks para estimar o tamanho do rosto
-            x_coords = [x for x, y in available_landmarks]
-            y_coords = [y for x, y in available_landmarks]
-            x_min, x_max = min(x_coords), max(x_coords)
-            y_min, y_max = min(y_coords), max(y_coords)
-            face_size = max(x_max - x_min, y_max - y_min)
+            center_x, center_y = (points.sum(axis=0) // len(points)).tolist()
+            face_size = int((points.max(axis=0) - points.min(axis=0)).max())
             
             # Ajusta o tamanho da tarja com base na dispersão dos landmarks
             tarja_size = max(100, min(int(face_size * 1.5), self.tarja_max_size))  # Fator 1.5 para garantir cobertura
@@ -111,10 +158,9 @@ class FaceUtils:
         y_max = min(h, center_y + half_size)
         
         # Aplica retângulo preto quadrado
-        frame_copy = frame.copy()
-        cv2.rectangle(frame_copy, (x_min, y_min), (x_max, y_max), (0, 0, 0), -1)
+        fill_black_rect(frame, x_min, y_min, x_max, y_max)
         
-        return frame_copy
+        return frame
     
     def _apply_face_oval(self, frame, face_landmarks):
         """
@@ -126,7 +172,7 @@ class FaceUtils:
             face_landmarks (dict): Dicionário com os landmarks do face_mesh
             
         Returns:
-            numpy.ndarray: Frame com tarja oval aplicada
+            numpy.ndarray: Frame com tarja oval aplicada (o próprio frame, modificado no lugar)
         """
         if not face_landmarks or len(face_landmarks) < 10:
             # Se não tiver landmarks suficientes, tenta usar o método quadrado
@@ -146,12 +192,12 @@ class FaceUtils:
                 if idx in face_landmarks:
                     contour_points.append(face_landmarks[idx])
             
+            # Converte para o formato numpy para cálculos (um único array por caminho)
             if len(contour_points) < 5:  # Precisamos de pelo menos 5 pontos para uma elipse
                 # Fallback para todos os pontos se não tivermos pontos de contorno suficientes
-                contour_points = list(face_landmarks.values())
-            
-            # Converte para o formato numpy para cálculos
-            contour_points = np.array(contour_points, dtype=np.int32)
+                contour_points = points_array(face_landmarks, dtype=np.int32)
+            else:
+                contour_points = np.array(contour_points, dtype=np.int32)
             
             # Calcula o retângulo delimitador da elipse
             x_coords = contour_points[:, 0]
@@ -172,25 +218,19 @@ class FaceUtils:
             axis_x = max(min_axis, min(axis_x, self.tarja_max_size // 2))
             axis_y = max(min_axis, min(axis_y, self.tarja_max_size // 2))
             
-            # Cria uma máscara do tamanho do frame
-            mask = np.zeros(frame.shape[:2], dtype=np.uint8)
-            
-            # Desenha a elipse preenchida na máscara
+            # Desenha a elipse preenchida de preto diretamente no frame
+            # (só os pixels da elipse são tocados, sem máscara nem cópia do tamanho do frame)
             cv2.ellipse(
-                mask,
+                frame,
                 (center_x, center_y),  # centro
                 (axis_x, axis_y),      # eixos
                 0,                     # ângulo
                 0, 360,                # ângulo inicial e final
-                (255),                 # cor (branco)
+                (0, 0, 0),             # cor (preto)
                 -1                     # espessura (preenchido)
             )
             
-            # Aplica a máscara ao frame (pinta de preto onde a máscara é branca)
-            frame_with_mask = frame.copy()
-            frame_with_mask[mask == 255] = (0, 0, 0)  # Preto
-            
-            return frame_with_mask
+            return frame
             
         except Exception as e:
             print(f"Erro ao aplicar tarja oval: {str(e)}")
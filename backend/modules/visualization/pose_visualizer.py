@@ -1,7 +1,7 @@
 import cv2
 import numpy as np
 import mediapipe as mp
-from ..core.utils import adjust_text_position
+from ..core.utils import adjust_text_position, get_text_size
 
 # Configurações globais do MediaPipe
 mpDraw = mp.solutions.drawing_utils
@@ -30,6 +30,40 @@ custom_pose_connections = [
     (27, 29), (28, 30)   # Tornozelo-calcanhar
 ]
 
+# IDs dos landmarks do corpo superior e inferior
+upper_body_ids = frozenset((11, 12, 13, 14, 15, 16))
+lower_body_ids = frozenset((23, 24, 25, 26, 27, 28, 29, 30, 31, 32))
+
+# Conexões filtradas para cada combinação de (show_upper_body, show_lower_body),
+# calculadas uma única vez na importação do módulo (conexões do corpo superior primeiro)
+filtered_pose_connections = {
+    (show_upper, show_lower): [
+        conn for conn in custom_pose_connections
+        if show_upper and (conn[0] in upper_body_ids or conn[1] in upper_body_ids)
+    ] + [
+        conn for conn in custom_pose_connections
+        if show_lower and (conn[0] in lower_body_ids or conn[1] in lower_body_ids)
+    ]
+    for show_upper in (False, True)
+    for show_lower in (False, True)
+}
+
+# IDs dos landmarks de interesse específicos de cada lado
+# Corpo superior - apenas ombro, cotovelo, pulso e dedo médio
+right_upper_body_ids = (12, 14, 16, 18)  # Ombro, cotovelo, pulso e dedo médio direito
+left_upper_body_ids = (11, 13, 15, 17)   # Ombro, cotovelo, pulso e dedo médio esquerdo
+
+# Corpo inferior - apenas quadril, joelho, tornozelo e foot index
+right_lower_body_ids = (24, 26, 28, 32)  # Quadril, joelho, tornozelo e foot index direito
+left_lower_body_ids = (23, 25, 27, 31)   # Quadril, joelho, tornozelo e foot index esquerdo
+
+# Tornozelos e pés, usados para decidir se a imagem é lateral
+ankle_foot_ids = (27, 28, 31, 32)
+
+# Pontos da mão que são sempre ocultados (todos exceto o dedo médio, 17 e 18,
+# usado para o cálculo do ângulo)
+hidden_hand_ids = (frozenset(range(17, 23)) | frozenset(range(18, 24))) - frozenset((17, 18))
+
 class PoseVisualizer:
     def __init__(self):
         """
@@ -78,25 +112,8 @@ class PoseVisualizer:
                     y = int(landmark.y * h)
                     landmarks_dict[i] = (x, y)
             
-            # Filtra as conexões personalizadas com base nas configurações
-            filtered_connections = []
-            
-            # Adiciona conexões do corpo superior se necessário
-            if show_upper_body:
-                upper_body_connections = [
-                    conn for conn in custom_pose_connections 
-                    if conn[0] in [11, 12, 13, 14, 15, 16] or conn[1] in [11, 12, 13, 14, 15, 16]
-                ]
-                filtered_connections.extend(upper_body_connections)
-            
-            # Adiciona conexões do corpo inferior se necessário
-            if show_lower_body:
-                lower_body_connections = [
-                    conn for conn in custom_pose_connections 
-                    if conn[0] in [23, 24, 25, 26, 27, 28, 29, 30, 31, 32] or 
-                       conn[1] in [23, 24, 25, 26, 27, 28, 29, 30, 31, 32]
-                ]
-                filtered_connections.extend(lower_body_connections)
+            # Conexões personalizadas filtradas com base nas configurações (pré-calculadas)
+            filtered_connections = filtered_pose_connections[(bool(show_upper_body), bool(show_lower_body))]
             
             # Desenha os landmarks modificados
             mpDraw.draw_landmarks(
@@ -134,15 +151,6 @@ class PoseVisualizer:
         import copy
         modified_landmarks = copy.deepcopy(landmarks)
         
-        # IDs dos landmarks de interesse específicos
-        # Corpo superior - apenas ombro, cotovelo, pulso e dedo médio
-        right_upper_body_ids = [12, 14, 16, 18]  # Ombro, cotovelo, pulso e dedo médio direito
-        left_upper_body_ids = [11, 13, 15, 17]   # Ombro, cotovelo, pulso e dedo médio esquerdo
-        
-        # Corpo inferior - apenas quadril, joelho, tornozelo e foot index
-        right_lower_body_ids = [24, 26, 28, 32]  # Quadril, joelho, tornozelo e foot index direito
-        left_lower_body_ids = [23, 25, 27, 31]   # Quadril, joelho, tornozelo e foot index esquerdo
-        
         # Determina qual lado é mais visível para o corpo superior
         right_upper_visibility = 0
         left_upper_visibility = 0
@@ -179,14 +187,13 @@ class PoseVisualizer:
         
         # Determina se a imagem é lateral (corpo superior) ou frontal (corpo inferior)
         # Verifica se os tornozelos e pés estão visíveis
-        ankle_foot_ids = [27, 28, 31, 32]  # Tornozelos e pés
         ankle_foot_visible = any(i < len(modified_landmarks.landmark) and modified_landmarks.landmark[i].visibility > 0.5 for i in ankle_foot_ids)
         
         # Se os tornozelos ou pés não estiverem visíveis, considera como imagem lateral
         is_lateral_view = not ankle_foot_visible
         
-        # Lista para armazenar os IDs dos landmarks a serem mantidos
-        ids_to_keep = []
+        # Conjunto dos IDs dos landmarks a serem mantidos
+        ids_to_keep = set()
         
         # Determina qual lado é mais visível no geral
         more_visible_side_upper = "right" if right_upper_visibility > left_upper_visibility else "left"
@@ -195,33 +202,30 @@ class PoseVisualizer:
         # Adiciona apenas o olho do lado mais visível
         if show_upper_body:
             if more_visible_side_upper == "right":
-                ids_to_keep.append(5)  # RIGHT_EYE
+                ids_to_keep.add(5)  # RIGHT_EYE
             else:
-                ids_to_keep.append(2)  # LEFT_EYE
+                ids_to_keep.add(2)  # LEFT_EYE
         
         # Adiciona os IDs do corpo superior do lado mais visível se necessário
         if show_upper_body:
             if more_visible_side_upper == "right":
-                ids_to_keep.extend(right_upper_body_ids)
+                ids_to_keep.update(right_upper_body_ids)
             else:
-                ids_to_keep.extend(left_upper_body_ids)
+                ids_to_keep.update(left_upper_body_ids)
         
         # Adiciona os IDs do corpo inferior do lado mais visível apenas se não for vista lateral
         if show_lower_body and not is_lateral_view:
             if more_visible_side_lower == "right":
-                ids_to_keep.extend(right_lower_body_ids)
+                ids_to_keep.update(right_lower_body_ids)
             else:
-                ids_to_keep.extend(left_lower_body_ids)
+                ids_to_keep.update(left_lower_body_ids)
         
         # Oculta todos os landmarks que não estão na lista de IDs a serem mantidos
         # e também oculta os pontos da mão, exceto o dedo médio que é usado para o cálculo do ângulo
         for i in range(len(modified_landmarks.landmark)):
             # Verifica se o landmark não está na lista de IDs a serem mantidos
             # ou se é um ponto da mão que não é o dedo médio (17 ou 18)
-            hand_landmarks = list(range(17, 23)) + list(range(18, 24))  # IDs dos landmarks da mão
-            middle_finger_ids = [17, 18]  # IDs do dedo médio (esquerdo e direito)
-            
-            if i not in ids_to_keep or (i in hand_landmarks and i not in middle_finger_ids):
+            if i not in ids_to_keep or i in hidden_hand_ids:
                 modified_landmarks.landmark[i].visibility = 0
         
         return modified_landmarks
@@ -307,15 +311,15 @@ class PoseVisualizer:
         offset_x = 20  # Deslocamento horizontal em pixels
         position = (position[0] + offset_x, position[1])
         
+        # Obtém o tamanho do texto, usado no ajuste de posição e no retângulo de fundo
+        text_w, text_h = get_text_size(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
+        
         # Ajusta a posição do texto para garantir que ele fique dentro dos limites do frame
         position = adjust_text_position(
-            frame, text, position, cv2.FONT_HERSHEY_SIMPLEX, font_scale, color, thickness
+            frame, text, position, cv2.FONT_HERSHEY_SIMPLEX, font_scale, color, thickness,
+            text_size=(text_w, text_h)
         )
         
-        # Obtém o tamanho do texto para criar o retângulo de fundo
-        text_size, _ = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness)
-        text_w, text_h = text_size
-        
         # Adiciona um fundo semi-transparente para destacar o texto
         # Coordenadas do retângulo (x1, y1) é o canto superior esquerdo e (x2, y2) é o canto inferior direito
         x1 = position[0] - 5  # 5 pixels de margem à esquerda
@@ -323,13 +327,15 @@ class PoseVisualizer:
         x2 = position[0] + text_w + 5  # 5 pixels de margem à direita
         y2 = position[1] + 5  # 5 pixels de margem abaixo
         
-        # Cria uma cópia do frame para aplicar o retângulo semi-transparente
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (x1, y1), (x2, y2), (0, 0, 0), -1)  # Retângulo preto preenchido
-        
-        # Aplica o retângulo com transparência
+        # Aplica o retângulo preto com transparência apenas na região do texto; fora dela a
+        # mistura com o próprio frame não altera os pixels, então não é preciso copiar o frame
         alpha = 0.6  # Nível de transparência (0 = transparente, 1 = opaco)
-        cv2.addWeighted(overlay, alpha, frame, 1 - alpha, 0, frame)
+        frame_h, frame_w = frame.shape[:2]
+        x_lo, x_hi = max(x1, 0), min(x2, frame_w - 1) + 1
+        y_lo, y_hi = max(y1, 0), min(y2, frame_h - 1) + 1
+        if x_lo < x_hi and y_lo < y_hi:
+            roi = frame[y_lo:y_hi, x_lo:x_hi]
+            frame[y_lo:y_hi, x_lo:x_hi] = cv2.addWeighted(roi, 1 - alpha, roi, 0, 0)
         
         # Desenha o texto sobre o retângulo
         cv2.putText(
@@ -1,6 +1,15 @@
+import bisect
+import logging
+import math
 import cv2
 import numpy as np
 import mediapipe as mp
+from .face_utils import fill_black_rect, points_array, single_eye_tarja_size
+
+# Erros de desenho são registrados em nível debug: por serem por frame, não devem travar
+# o pipeline escrevendo no console (a aplicação decide se e onde exibi-los)
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 # Configurações globais do MediaPipe
 mpDraw = mp.solutions.drawing_utils
@@ -13,6 +22,28 @@ landmark_color = (245, 117, 66)  # Laranja para landmarks
 connection_color = (214, 121, 108)  # Rosa para conexões
 text_color = (255, 255, 255)  # Branco para texto
 
+# Cores por pontuação do ombro (índice = pontuação - 1)
+shoulder_score_colors = (
+    (0, 255, 0),    # 1: Verde (0° a 20°)
+    (0, 255, 255),  # 2: Amarelo (>20° a 45°)
+    (0, 165, 255),  # 3: Laranja (>45° a 90°)
+    (0, 0, 255),    # 4: Vermelho (>90°)
+)
+
+# Cores por pontuação do antebraço (índice = pontuação - 1)
+forearm_score_colors = (
+    (0, 255, 0),    # 1: Verde (60° a 100°)
+    (0, 255, 255),  # 2: Amarelo (fora da faixa)
+)
+
+# Limites (inclusivos) do ângulo da coluna em relação à vertical e a cor de cada faixa
+spine_angle_thresholds = (5, 10)
+spine_angle_colors = (
+    (0, 255, 0),    # Até 5°: postura excelente - Verde
+    (0, 255, 255),  # Até 10°: postura com atenção - Amarelo
+    (0, 0, 255),    # Acima de 10°: postura ruim - Vermelho
+)
+
 # Define as conexões personalizadas para vídeos (lógica original)
 custom_video_pose_connections = [
     # Corpo superior
@@ -29,11 +60,144 @@ custom_video_pose_connections = [
     (27, 29), (28, 30)   # Tornozelo-calcanhar
 ]
 
+# IDs dos landmarks do corpo superior e inferior
+upper_body_ids = frozenset((11, 12, 13, 14, 15, 16))
+lower_body_ids = frozenset((23, 24, 25, 26, 27, 28, 29, 30, 31, 32))
+
+# Número de landmarks do MediaPipe Pose (os IDs vão de 0 a 32)
+pose_landmark_count = 33
+
+# Conexões filtradas para cada combinação de (show_upper_body, show_lower_body),
+# calculadas uma única vez na importação do módulo como arrays (K, 2) de IDs
+filtered_video_connections = {
+    (show_upper, show_lower): np.array([
+        (start_id, end_id) for start_id, end_id in custom_video_pose_connections
+        if (show_upper and (start_id in upper_body_ids or end_id in upper_body_ids))
+        or (show_lower and (start_id in lower_body_ids or end_id in lower_body_ids))
+    ], dtype=np.intp).reshape(-1, 2)
+    for show_upper in (False, True)
+    for show_lower in (False, True)
+}
+
+# Caso padrão (corpo superior e inferior): toda conexão toca um dos dois grupos
+all_video_connections = filtered_video_connections[(True, True)]
+
+# Tabelas booleanas (indexadas pelo ID) dos landmarks desenhados para cada combinação
+# de (show_upper_body, show_lower_body)
+drawn_landmark_masks = {
+    (show_upper, show_lower): np.isin(
+        np.arange(pose_landmark_count),
+        list((upper_body_ids if show_upper else frozenset()) | (lower_body_ids if show_lower else frozenset()))
+    )
+    for show_upper in (False, True)
+    for show_lower in (False, True)
+}
+
 # As conexões para visualização do pescoço foram removidas
 
 # Define as conexões para visualização da coluna vertebral
 spine_connections = [(11, 12), (23, 24)]  # Ombros e quadris
 
+# Pontos do contorno facial no face_mesh (aproximadamente)
+face_contour_indices = (
+    10, 338, 297, 332, 284, 251, 389, 356, 454, 323, 361, 288,
+    397, 365, 379, 378, 400, 377, 152, 148, 176, 149, 150, 136,
+    172, 58, 132, 93, 234, 127, 162, 21, 54, 103, 67, 109
+)
+
+def _landmarks_to_array(pose_landmarks):
+    """
+    Copia os landmarks do MediaPipe para um array em uma única passada.
+    
+    Args:
+        pose_landmarks: Lista de landmarks normalizados do MediaPipe
+        
+    Returns:
+        numpy.ndarray: Array (N, 3) com x, y e visibilidade de cada landmark
+    """
+    landmarks = pose_landmarks.landmark
+    coords = np.fromiter(
+        (value for landmark in landmarks for value in (landmark.x, landmark.y, landmark.visibility)),
+        dtype=np.float64,
+        count=3 * len(landmarks)
+    )
+    return coords.reshape(-1, 3)
+
+def _landmarks_to_pixels(coords, frame_size, threshold):
+    """
+    Converte landmarks normalizados em coordenadas de pixel de forma vetorizada.
+    
+    O resultado é denso: a linha i corresponde ao landmark de ID i, e a máscara
+    indica quais landmarks têm visibilidade suficiente.
+    
+    Args:
+        coords (numpy.ndarray): Array (N, 3) com x, y e visibilidade normalizados
+        frame_size (numpy.ndarray): Vetor (largura, altura) do frame
+        threshold (float): Visibilidade mínima para manter o landmark
+        
+    Returns:
+        numpy.ndarray: Array (N, 2) int32 com as coordenadas (x, y) de cada landmark
+        numpy.ndarray: Máscara booleana (N,) dos landmarks com visibilidade suficiente
+    """
+    visible = coords[:, 2] >= threshold
+    pixels = coords[:, :2] * frame_size
+    # Landmarks descartados não são usados; zerá-los evita converter valores extrapolados
+    pixels[~visible] = 0
+    # astype trunca em direção a zero, como int() fazia por landmark
+    return pixels.astype(np.int32), visible
+
+def _midpoint(point_a, point_b):
+    """
+    Calcula o ponto médio (em pixels inteiros) entre dois pontos.
+    
+    Args:
+        point_a (tuple): Coordenadas (x, y) do primeiro ponto
+        point_b (tuple): Coordenadas (x, y) do segundo ponto
+        
+    Returns:
+        tuple: Coordenadas (x, y) do ponto médio
+    """
+    return ((point_a[0] + point_b[0]) // 2, (point_a[1] + point_b[1]) // 2)
+
+def _draw_angle_segment(frame, start, end, color):
+    """
+    Desenha o segmento de um ângulo avaliado: a linha e os dois pontos das extremidades na mesma cor.
+    
+    Args:
+        frame (numpy.ndarray): Frame onde desenhar (modificado no lugar)
+        start (tuple): Coordenadas (x, y) do início do segmento
+        end (tuple): Coordenadas (x, y) do fim do segmento
+        color (tuple): Cor (B, G, R) definida pela avaliação do ângulo
+    """
+    cv2.line(frame, start, end, color, thickness=4)
+    cv2.circle(frame, start, radius=5, color=color, thickness=-1)  # Preenchido
+    cv2.circle(frame, end, radius=5, color=color, thickness=-1)  # Preenchido
+
+def _visible_segments(segments, width, height, margin):
+    """
+    Descarta segmentos que ficam inteiramente fora do frame.
+    
+    Um segmento é descartado quando as duas extremidades estão além da mesma borda
+    (rejeição trivial, como no recorte de Cohen-Sutherland). A margem deve cobrir a
+    espessura do traço, para que segmentos que apenas encostam na borda continuem sendo desenhados.
+    
+    Args:
+        segments (numpy.ndarray): Array (N, 2, 2) com as extremidades de cada segmento
+        width (int): Largura do frame
+        height (int): Altura do frame
+        margin (int): Distância além da borda a partir da qual o traço não aparece
+        
+    Returns:
+        numpy.ndarray: Segmentos que podem tocar o frame
+    """
+    x = segments[:, :, 0]
+    y = segments[:, :, 1]
+    outside = (
+        (x < -margin).all(axis=1) | (x >= width + margin).all(axis=1)
+        | (y < -margin).all(axis=1) | (y >= height + margin).all(axis=1)
+    )
+    return segments[~outside]
+
 class VideoVisualizer:
     """
     Visualizador específico para processamento de vídeos.
@@ -50,11 +214,16 @@ class VideoVisualizer:
             landmark_quality_threshold (float): Limiar de qualidade para exibição de landmarks (0.0 a 1.0)
                                               Landmarks com confiança abaixo deste valor não serão exibidos
         """
-        self.mp_drawing = mp.solutions.drawing_utils
-        self.mp_pose = mp.solutions.pose
+        self.mp_drawing = mpDraw
+        self.mp_pose = mpPose
         self.tarja_ratio = tarja_ratio  # Proporção para calcular tamanho da tarja
         self.tarja_max_size = tarja_max_size  # Tamanho máximo da tarja em pixels
+        self._min_axis = 50  # Tamanho mínimo de cada eixo da tarja oval
+        self._tarja_max_half = tarja_max_size // 2  # Tamanho máximo de cada eixo da tarja oval
         self.landmark_quality_threshold = landmark_quality_threshold  # Limiar de qualidade para exibição
+        # (dimensões do último frame, vetor (largura, altura) usado na conversão para pixels);
+        # ficam na mesma tupla para serem publicados juntos entre threads
+        self._frame_scale = (None, None)
         
         # Importa o analisador de ângulos para cálculos
         from ..analysis.angle_analyzer import AngleAnalyzer
@@ -76,47 +245,59 @@ class VideoVisualizer:
         """
         if not results.pose_landmarks:
             return frame
+        
+        # Sem nenhuma parte do corpo habilitada não há nada a desenhar
+        if not (show_upper_body or show_lower_body):
+            return frame
             
         try:
             # Obtém dimensões do frame
             h, w, _ = frame.shape
             
+            # O vetor de escala só muda quando muda a resolução do vídeo; é montado antes de ser
+            # publicado, pois process_video_parallel chama este método de várias threads
+            frame_shape, frame_size = self._frame_scale
+            if frame_shape != (h, w):
+                frame_size = np.array([w, h], dtype=np.float64)
+                self._frame_scale = ((h, w), frame_size)
+            
             # Converte landmarks para coordenadas de pixel, aplicando o limiar de qualidade
-            landmarks_dict = {}
-            for i, landmark in enumerate(results.pose_landmarks.landmark):
-                # Só considera landmarks com visibilidade acima do limiar de qualidade
-                if landmark.visibility >= self.landmark_quality_threshold:  
-                    x = int(landmark.x * w)
-                    y = int(landmark.y * h)
-                    landmarks_dict[i] = (x, y)
+            coords = _landmarks_to_array(results.pose_landmarks)
+            pixels, visible = _landmarks_to_pixels(coords, frame_size, self.landmark_quality_threshold)
             
             # Se não houver landmarks com qualidade suficiente, retorna o frame sem alterações
-            if not landmarks_dict:
+            if not visible.any():
                 return frame
             
-            # Filtra conexões baseado nas configurações
-            connections_to_draw = self._filter_video_connections(
-                show_upper_body, 
-                show_lower_body
-            )
+            if show_upper_body and show_lower_body:
+                # Caso padrão: toda conexão toca o corpo superior ou inferior, dispensando o filtro
+                connections_to_draw = all_video_connections
+            else:
+                # Filtra conexões baseado nas configurações
+                connections_to_draw = self._filter_video_connections(
+                    show_upper_body, 
+                    show_lower_body
+                )
             
             # Desenha as conexões personalizadas
             self._draw_video_connections(
                 frame, 
-                landmarks_dict, 
+                pixels, 
+                visible, 
                 connections_to_draw
             )
             
             # Desenha os landmarks
             self._draw_video_landmarks_points(
                 frame, 
-                landmarks_dict, 
+                pixels, 
+                visible, 
                 show_upper_body, 
                 show_lower_body
             )
             
         except Exception as e:
-            print(f"Erro ao desenhar landmarks do vídeo: {str(e)}")
+            logger.debug("Erro ao desenhar landmarks do vídeo: %s", e, exc_info=True)
             
         return frame
     
@@ -129,89 +310,75 @@ class VideoVisualizer:
             show_lower_body (bool): Se deve mostrar corpo inferior
             
         Returns:
-            list: Lista de conexões filtradas
+            numpy.ndarray: Array (K, 2) com os IDs das conexões filtradas (pré-calculado na importação do módulo)
         """
-        filtered_connections = []
-        
-        # IDs dos landmarks do corpo superior
-        upper_body_ids = [11, 12, 13, 14, 15, 16]
-        
-        # IDs dos landmarks do corpo inferior
-        lower_body_ids = [23, 24, 25, 26, 27, 28, 29, 30, 31, 32]
-        
-        for connection in custom_video_pose_connections:
-            start_id, end_id = connection
-            
-            # Verifica se a conexão pertence ao corpo superior
-            is_upper = (start_id in upper_body_ids or end_id in upper_body_ids)
-            
-            # Verifica se a conexão pertence ao corpo inferior
-            is_lower = (start_id in lower_body_ids or end_id in lower_body_ids)
-            
-            # Adiciona a conexão se deve ser mostrada
-            if (show_upper_body and is_upper) or (show_lower_body and is_lower):
-                filtered_connections.append(connection)
-        
-        return filtered_connections
+        return filtered_video_connections[(bool(show_upper_body), bool(show_lower_body))]
     
-    def _draw_video_connections(self, frame, landmarks_dict, connections):
+    def _draw_video_connections(self, frame, pixels, visible, connections):
         """
         Desenha as conexões entre landmarks.
         
         Args:
             frame (numpy.ndarray): Frame onde desenhar
-            landmarks_dict (dict): Dicionário com coordenadas dos landmarks
-            connections (list): Lista de conexões para desenhar
+            pixels (numpy.ndarray): Array (N, 2) com as coordenadas de cada landmark, indexado pelo ID
+            visible (numpy.ndarray): Máscara (N,) dos landmarks com qualidade suficiente
+            connections (numpy.ndarray): Array (K, 2) com os IDs das conexões para desenhar
         """
-        for connection in connections:
-            start_id, end_id = connection
-            
-            if start_id in landmarks_dict and end_id in landmarks_dict:
-                start_point = landmarks_dict[start_id]
-                end_point = landmarks_dict[end_id]
-                
-                cv2.line(
-                    frame, 
-                    start_point, 
-                    end_point, 
-                    connection_color, 
-                    thickness=4
-                )
+        # Reúne os segmentos com as duas extremidades disponíveis (indexação direta pelos IDs)
+        segments = pixels[connections][visible[connections].all(axis=1)]
+
+        if not len(segments):
+            return
+
+        # Landmarks extrapolados pelo MediaPipe podem cair fora do frame
+        segments = _visible_segments(segments, frame.shape[1], frame.shape[0], 4)
+        if not len(segments):
+            return
+
+        # Desenha todos os segmentos em uma única chamada (mesmo resultado de um cv2.line por conexão)
+        cv2.polylines(
+            frame,
+            segments,
+            isClosed=False,
+            color=connection_color,
+            thickness=4
+        )
     
-    def _draw_video_landmarks_points(self, frame, landmarks_dict, show_upper_body, show_lower_body):
+    def _draw_video_landmarks_points(self, frame, pixels, visible, show_upper_body, show_lower_body):
         """
         Desenha os pontos dos landmarks.
         
         Args:
             frame (numpy.ndarray): Frame onde desenhar
-            landmarks_dict (dict): Dicionário com coordenadas dos landmarks
+            pixels (numpy.ndarray): Array (N, 2) com as coordenadas de cada landmark, indexado pelo ID
+            visible (numpy.ndarray): Máscara (N,) dos landmarks com qualidade suficiente
             show_upper_body (bool): Se deve mostrar corpo superior
             show_lower_body (bool): Se deve mostrar corpo inferior
         """
-        # IDs dos landmarks do corpo superior
-        upper_body_ids = [11, 12, 13, 14, 15, 16]
-        
-        # IDs dos landmarks do corpo inferior
-        lower_body_ids = [23, 24, 25, 26, 27, 28, 29, 30, 31, 32]
-        
-        for landmark_id, (x, y) in landmarks_dict.items():
-            # Verifica se deve desenhar este landmark
-            should_draw = False
-            
-            if show_upper_body and landmark_id in upper_body_ids:
-                should_draw = True
-            elif show_lower_body and landmark_id in lower_body_ids:
-                should_draw = True
-            
-            if should_draw:
-                cv2.circle(
-                    frame, 
-                    (x, y), 
-                    radius=4, 
-                    color=landmark_color, 
-                    thickness=-1  # Preenchido
-                )
-                
+        # Seleciona de uma vez os landmarks visíveis que devem ser desenhados
+        mask = visible & drawn_landmark_masks[(bool(show_upper_body), bool(show_lower_body))]
+        
+        if not mask.any():
+            return
+        
+        points = pixels[mask]
+        
+        # Um segmento degenerado (início = fim) com espessura 8 é desenhado pelo OpenCV como
+        # um círculo preenchido de raio 4, idêntico ao cv2.circle(radius=4, thickness=-1);
+        # assim todos os pontos saem em uma única chamada
+        points = _visible_segments(np.repeat(points[:, np.newaxis, :], 2, axis=1), frame.shape[1], frame.shape[0], 8)
+        if not len(points):
+            return
+        
+        cv2.polylines(
+            frame,
+            points,
+            isClosed=False,
+            color=landmark_color,
+            thickness=8
+        )
+    
+
     def draw_spine_angle(self, frame, landmarks_dict, use_vertical_reference=True):
         """
         Desenha o ângulo da coluna vertebral no frame, alterando a cor da linha de acordo com a avaliação da postura.
@@ -232,81 +399,37 @@ class VideoVisualizer:
             return frame, None
         
         try:
-            # Calcula o ângulo da coluna
-            spine_angle = self.angle_analyzer.calculate_spine_angle(
+            # Calcula o ângulo da coluna, reaproveitando os pontos médios dos ombros e
+            # dos quadris usados no cálculo para desenhar a linha
+            spine_angle, shoulder_midpoint, hip_midpoint = self.angle_analyzer.calculate_spine_angle(
                 landmarks_dict, 
-                use_vertical_reference=use_vertical_reference
+                use_vertical_reference=use_vertical_reference,
+                return_midpoints=True
             )
             
             if spine_angle is None:
                 return frame, None
             
-            # Calcula o ponto médio entre os ombros
-            left_shoulder = landmarks_dict[11]
-            right_shoulder = landmarks_dict[12]
-            shoulder_midpoint = (
-                (left_shoulder[0] + right_shoulder[0]) // 2,
-                (left_shoulder[1] + right_shoulder[1]) // 2
-            )
-            
-            # Calcula o ponto médio entre os quadris
-            left_hip = landmarks_dict[23]
-            right_hip = landmarks_dict[24]
-            hip_midpoint = (
-                (left_hip[0] + right_hip[0]) // 2,
-                (left_hip[1] + right_hip[1]) // 2
-            )
-            
             # Arredonda o ângulo para avaliação
             spine_angle_rounded = round(spine_angle, 1)
             
             # Determina a cor da linha da coluna com base no ângulo
             if use_vertical_reference:
-                if spine_angle_rounded <= 5:
-                    # Postura excelente - Verde
-                    spine_color = (0, 255, 0)  # BGR - Verde
-                elif spine_angle_rounded <= 10:
-                    # Postura com atenção - Amarelo
-                    spine_color = (0, 255, 255)  # BGR - Amarelo
-                else:
-                    # Postura ruim - Vermelho
-                    spine_color = (0, 0, 255)  # BGR - Vermelho
+                # bisect_left devolve a primeira faixa cujo limite é >= ângulo
+                spine_color = spine_angle_colors[bisect.bisect_left(spine_angle_thresholds, spine_angle_rounded)]
             else:
                 # Para ângulo interno, usar uma lógica diferente se necessário
                 spine_color = (0, 255, 0)  # Verde por padrão
             
             # Desenha a linha da coluna com a cor determinada pela avaliação
-            cv2.line(
-                frame,
-                shoulder_midpoint,
-                hip_midpoint,
-                spine_color,
-                thickness=4
-            )
-            
-            # Desenha os pontos médios com a mesma cor da linha
-            cv2.circle(
-                frame,
-                shoulder_midpoint,
-                radius=5,
-                color=spine_color,
-                thickness=-1  # Preenchido
-            )
-            
-            cv2.circle(
-                frame,
-                hip_midpoint,
-                radius=5,
-                color=spine_color,
-                thickness=-1  # Preenchido
-            )
+            _draw_angle_segment(frame, shoulder_midpoint, hip_midpoint, spine_color)
             
             # Linha vertical de referência removida conforme solicitado
             
             return frame, spine_angle
             
         except Exception as e:
-            print(f"Erro ao desenhar ângulo da coluna: {str(e)}")
+            logger.debug("Erro ao desenhar ângulo da coluna: %s", e, exc_info=True)
             return frame, None
     
     # A função draw_neck_angle foi removida
@@ -355,47 +478,17 @@ class VideoVisualizer:
             elbow = landmarks_dict[elbow_id]
             
             # Determina a cor com base na pontuação
-            if score == 1:
-                color = (0, 255, 0)  # Verde (0° a 20°)
-            elif score == 2:
-                color = (0, 255, 255)  # Amarelo (>20° a 45°)
-            elif score == 3:
-                color = (0, 165, 255)  # Laranja (>45° a 90°)
-            else:  # score == 4
-                color = (0, 0, 255)  # Vermelho (>90°)
+            color = shoulder_score_colors[min(max(score, 1), 4) - 1]
             
             # Desenha a linha do braço com a cor determinada pela pontuação
-            cv2.line(
-                frame,
-                shoulder,
-                elbow,
-                color,
-                thickness=4
-            )
-            
-            # Desenha círculos nos pontos
-            cv2.circle(
-                frame,
-                shoulder,
-                radius=5,
-                color=color,
-                thickness=-1  # Preenchido
-            )
-            
-            cv2.circle(
-                frame,
-                elbow,
-                radius=5,
-                color=color,
-                thickness=-1  # Preenchido
-            )
+            _draw_angle_segment(frame, shoulder, elbow, color)
             
             # Linha vertical de referência removida conforme solicitado
             
             return frame, shoulder_angle, score
             
         except Exception as e:
-            print(f"Erro ao desenhar ângulo do ombro: {str(e)}")
+            logger.debug("Erro ao desenhar ângulo do ombro: %s", e, exc_info=True)
             return frame, None, None
     
     def draw_forearm_angle(self, frame, landmarks_dict, side='right'):
@@ -438,43 +531,17 @@ class VideoVisualizer:
             wrist = landmarks_dict[wrist_id]
             
             # Determina a cor com base na pontuação
-            if score == 1:
-                color = (0, 255, 0)  # Verde (60° a 100°)
-            else:  # score == 2
-                color = (0, 255, 255)  # Amarelo (fora da faixa)
+            color = forearm_score_colors[min(max(score, 1), 2) - 1]
             
             # Desenha a linha do antebraço com a cor determinada pela pontuação
-            cv2.line(
-                frame,
-                elbow,
-                wrist,
-                color,
-                thickness=4
-            )
-            
-            # Desenha círculos nos pontos
-            cv2.circle(
-                frame,
-                elbow,
-                radius=5,
-                color=color,
-                thickness=-1  # Preenchido
-            )
-            
-            cv2.circle(
-                frame,
-                wrist,
-                radius=5,
-                color=color,
-                thickness=-1  # Preenchido
-            )
+            _draw_angle_segment(frame, elbow, wrist, color)
             
             # Texto com ângulo removido conforme solicitado
             
             return frame, forearm_angle, score
             
         except Exception as e:
-            print(f"Erro ao desenhar ângulo do antebraço: {str(e)}")
+            logger.debug("Erro ao desenhar ângulo do antebraço: %s", e, exc_info=True)
             return frame, None, None
     
     def apply_face_blur(self, frame, face_landmarks=None, eye_landmarks=None):
@@ -501,7 +568,7 @@ class VideoVisualizer:
                 return frame
                 
         except Exception as e:
-            print(f"Erro ao aplicar tarja facial: {str(e)}")
+            logger.debug("Erro ao aplicar tarja facial: %s", e, exc_info=True)
             return frame
     
     def _apply_face_tarja_from_face(self, frame, face_landmarks):
@@ -513,44 +580,21 @@ class VideoVisualizer:
             return frame
             
         # Calcula centro dos landmarks faciais
-        x_coords = [coord[0] for coord in face_landmarks.values()]
-        y_coords = [coord[1] for coord in face_landmarks.values()]
-        
-        if not x_coords or not y_coords:
-            return frame
-            
-        center_x = sum(x_coords) // len(x_coords)
-        center_y = sum(y_coords) // len(y_coords)
+        points = points_array(face_landmarks)
+        center_x, center_y = (points.sum(axis=0) // len(points)).tolist()
         
         # Estima a distância da pessoa com base na dispersão dos landmarks faciais
         # Quanto maior a dispersão, mais próxima a pessoa está da câmera
-        x_min, x_max = min(x_coords), max(x_coords)
-        y_min, y_max = min(y_coords), max(y_coords)
-        face_width = x_max - x_min
-        face_height = y_max - y_min
-        face_size = max(face_width, face_height)
+        face_size = int((points.max(axis=0) - points.min(axis=0)).max())
         
         # Calcula tamanho da tarja proporcional ao tamanho do rosto
         # Quanto menor o rosto (pessoa mais distante), menor a tarja
-        frame_width = frame.shape[1]
-        face_ratio = face_size / frame_width  # Proporção do rosto em relação à largura do frame
-        
         # Ajusta o tamanho da tarja com base na proporção do rosto
         # Usa um fator de escala para garantir que a tarja cubra adequadamente o rosto
         scale_factor = 1.5  # Fator para garantir que a tarja seja maior que o rosto
         tarja_size = max(100, min(int(face_size * scale_factor), self.tarja_max_size))  # Mínimo 100px, máximo limitado
         
-        # Calcula coordenadas do quadrado centrado
-        half_size = tarja_size // 2
-        x_min = max(0, center_x - half_size)
-        y_min = max(0, center_y - half_size)
-        x_max = min(frame.shape[1], center_x + half_size)
-        y_max = min(frame.shape[0], center_y + half_size)
-        
-        # Aplica retângulo preto quadrado
-        cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), (0, 0, 0), -1)
-        
-        return frame
+        return self._draw_square_tarja(frame, center_x, center_y, tarja_size)
     
     def _apply_face_tarja_from_eyes(self, frame, eye_landmarks):
         """
@@ -566,17 +610,13 @@ class VideoVisualizer:
         
         if left_eye and right_eye:
             # Calcula centro baseado nos dois olhos
-            center_x = (left_eye[0] + right_eye[0]) // 2
-            center_y = (left_eye[1] + right_eye[1]) // 2
+            center_x, center_y = _midpoint(left_eye, right_eye)
             
             # Calcula a distância entre os olhos para estimar o tamanho do rosto
             # Quanto maior a distância, mais próxima a pessoa está da câmera
-            eye_distance = np.sqrt((right_eye[0] - left_eye[0])**2 + (right_eye[1] - left_eye[1])**2)
+            eye_distance = math.hypot(right_eye[0] - left_eye[0], right_eye[1] - left_eye[1])
             
             # Calcula tamanho da tarja proporcional à distância entre os olhos
-            frame_width = frame.shape[1]
-            eye_ratio = eye_distance / frame_width  # Proporção da distância dos olhos em relação à largura do frame
-            
             # Ajusta o tamanho da tarja com base na distância entre os olhos
             # Usa um fator de escala para garantir que a tarja cubra adequadamente o rosto
             scale_factor = 3.0  # Fator para garantir que a tarja seja maior que a distância entre os olhos
@@ -584,29 +624,36 @@ class VideoVisualizer:
         elif left_eye or right_eye:
             # Se tiver apenas um olho, usa um tamanho padrão menor
             center_x, center_y = left_eye if left_eye else right_eye
-            frame_width = frame.shape[1]
-            tarja_size = max(100, min(int(frame_width * 0.15), self.tarja_max_size))  # Usa 15% da largura do frame
+            tarja_size = single_eye_tarja_size(frame.shape[1], self.tarja_max_size)
         else:
             # Tenta usar outros landmarks faciais disponíveis
-            available_landmarks = [(x, y) for x, y in eye_landmarks.values() if x > 0 and y > 0]
-            if not available_landmarks:
+            points = points_array(eye_landmarks)
+            points = points[(points > 0).all(axis=1)]
+            if not len(points):
                 return frame
             
             # Calcula o centro e estima o tamanho com base na dispersão dos landmarks
-            center_x = sum(x for x, y in available_landmarks) // len(available_landmarks)
-            center_y = sum(y for x, y in available_landmarks) // len(available_landmarks)
-            
-            # Calcula a dispersão dos landmarks para estimar o tamanho do rosto
-            x_coords = [x for x, y in available_landmarks]
-            y_coords = [y for x, y in available_landmarks]
-            x_min, x_max = min(x_coords), max(x_coords)
-            y_min, y_max = min(y_coords), max(y_coords)
-            face_size = max(x_max - x_min, y_max - y_min)
+            center_x, center_y = (points.sum(axis=0) // len(points)).tolist()
+            face_size = int((points.max(axis=0) - points.min(axis=0)).max())
             
             # Ajusta o tamanho da tarja com base na dispersão dos landmarks
-            frame_width = frame.shape[1]
             tarja_size = max(100, min(int(face_size * 1.5), self.tarja_max_size))  # Fator 1.5 para garantir cobertura
         
+        return self._draw_square_tarja(frame, center_x, center_y, tarja_size)
+        
+    def _draw_square_tarja(self, frame, center_x, center_y, tarja_size):
+        """
+        Aplica a tarja quadrada preta centrada no rosto.
+        
+        Args:
+            frame (numpy.ndarray): Frame a ser processado
+            center_x (int): Coordenada x do centro da tarja
+            center_y (int): Coordenada y do centro da tarja
+            tarja_size (int): Lado da tarja em pixels
+            
+        Returns:
+            numpy.ndarray: Frame com a tarja aplicada (o próprio frame, modificado no lugar)
+        """
         # Calcula coordenadas do quadrado centrado
         half_size = tarja_size // 2
         x_min = max(0, center_x - half_size)
@@ -615,10 +662,10 @@ class VideoVisualizer:
         y_max = min(frame.shape[0], center_y + half_size)
         
         # Aplica retângulo preto quadrado
-        cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), (0, 0, 0), -1)
+        fill_black_rect(frame, x_min, y_min, x_max, y_max)
         
         return frame
-        
+    
     def _apply_face_oval_tarja_from_face_mesh(self, frame, face_landmarks):
         """
         Aplica tarja oval baseada nos landmarks do face_mesh.
@@ -629,31 +676,20 @@ class VideoVisualizer:
             face_landmarks (dict): Dicionário com os landmarks do face_mesh
             
         Returns:
-            numpy.ndarray: Frame com tarja oval aplicada
+            numpy.ndarray: Frame com tarja oval aplicada (o próprio frame, modificado no lugar)
         """
         if not face_landmarks or len(face_landmarks) < 10:
             return frame
             
         try:
             # Extrai os pontos do contorno do rosto do face_mesh
-            # Pontos do contorno facial no face_mesh (aproximadamente)
-            contour_indices = [
-                10, 338, 297, 332, 284, 251, 389, 356, 454, 323, 361, 288,
-                397, 365, 379, 378, 400, 377, 152, 148, 176, 149, 150, 136,
-                172, 58, 132, 93, 234, 127, 162, 21, 54, 103, 67, 109
-            ]
-            
-            contour_points = []
-            for idx in contour_indices:
-                if idx in face_landmarks:
-                    contour_points.append(face_landmarks[idx])
+            contour_points = [face_landmarks[idx] for idx in face_contour_indices if idx in face_landmarks]
             
             if len(contour_points) < 5:  # Precisamos de pelo menos 5 pontos para uma elipse
                 # Fallback para todos os pontos se não tivermos pontos de contorno suficientes
-                contour_points = list(face_landmarks.values())
-            
-            # Converte para o formato numpy para cálculos
-            contour_points = np.array(contour_points, dtype=np.int32)
+                contour_points = points_array(face_landmarks)
+            else:
+                contour_points = np.array(contour_points, dtype=np.int64)
             
             # Calcula o retângulo delimitador da elipse
             x_coords = contour_points[:, 0]
@@ -670,5127 +706,24 @@ class VideoVisualizer:
             axis_y = int((np.max(y_coords) - np.min(y_coords)) * margin_factor / 2)
             
             # Garante tamanho mínimo e máximo para a elipse
-            min_axis = 50  # Tamanho mínimo para cada eixo
-            axis_x = max(min_axis, min(axis_x, self.tarja_max_size // 2))
-            axis_y = max(min_axis, min(axis_y, self.tarja_max_size // 2))
+            axis_x = max(self._min_axis, min(axis_x, self._tarja_max_half))
+            axis_y = max(self._min_axis, min(axis_y, self._tarja_max_half))
             
-            # Cria uma máscara do tamanho do frame
-            mask = np.zeros(frame.shape[:2], dtype=np.uint8)
-            
-            # Desenha a elipse preenchida na máscara
+            # Desenha a elipse preenchida de preto diretamente no frame
+            # (só os pixels da elipse são tocados, sem máscara do tamanho do frame)
             cv2.ellipse(
-                mask,
+                frame,
                 (center_x, center_y),  # centro
                 (axis_x, axis_y),      # eixos
                 0,                     # ângulo
                 0, 360,                # ângulo inicial e final
-                (255),                 # cor (branco)
+                (0, 0, 0),             # cor (preto)
                 -1                     # espessura (preenchido)
             )
             
-            # Aplica a máscara ao frame (pinta de preto onde a máscara é branca)
-            frame_with_mask = frame.copy()
-            frame_with_mask[mask == 255] = (0, 0, 0)  # Preto
-            
-            return frame_with_mask
+            return frame
             
         except Exception as e:
-            print(f"Erro ao aplicar tarja oval: {str(e)}")
+            logger.debug("Erro ao aplicar tarja oval: %s", e, exc_info=True)
             # Em caso de erro, volta para o método retangular
             return self._apply_face_tarja_from_face(frame, face_landmarks)
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
-        
-        return frame
\ No newline at end of file
@@ -0,0 +1,204 @@
+"""
+Testes do pipeline com threads do VideoProcessor (leitura, processamento e escrita).
+
+O processamento de cada frame (MediaPipe e desenho) é substituído por uma função
+identidade: aqui só interessa o encadeamento das threads e das filas.
+
+Uso (a partir da pasta backend):
+    python -m unittest discover -s tests
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from modules.processors import video_processor
+from modules.processors.video_processor import VideoProcessor
+
+# Tempo máximo de espera por uma chamada antes de considerá-la travada
+timeout_seconds = 10
+
+
+def make_processor(config=None):
+    """
+    Cria um VideoProcessor sem carregar os modelos, com processamento identidade.
+    """
+    processor = VideoProcessor.__new__(VideoProcessor)
+    processor.config = config or {}
+    processor._process_frame = lambda frame, *args, **kwargs: frame
+    return processor
+
+
+def run_with_timeout(target, *args, **kwargs):
+    """
+    Executa a função em outra thread e devolve (terminou, resultado).
+    """
+    result = {}
+
+    def run():
+        result['value'] = target(*args, **kwargs)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout_seconds)
+    return not thread.is_alive(), result.get('value')
+
+
+class FakeCapture:
+    """
+    Fonte de vídeo com frames numerados (o valor dos pixels é o índice do frame).
+    Com total=None a fonte nunca termina, como uma câmera.
+    """
+
+    def __init__(self, total=None, delay=0.0):
+        self.total = total
+        self.delay = delay
+        self.index = 0
+
+    def read(self):
+        if self.total is not None and self.index >= self.total:
+            return False, None
+        if self.delay:
+            time.sleep(self.delay)
+        frame = np.full((8, 8, 3), self.index % 256, dtype=np.uint8)
+        self.index += 1
+        return True, frame
+
+
+class ProcessStreamRealtimeTest(unittest.TestCase):
+
+    def test_end_of_stream_returns(self):
+        processor = make_processor()
+        received = []
+
+        finished, stats = run_with_timeout(
+            processor.process_stream_realtime, FakeCapture(total=20), received.append
+        )
+
+        self.assertTrue(finished, "process_stream_realtime não retornou no fim da fonte")
+        self.assertEqual(stats['processed'], len(received))
+        self.assertEqual(stats['processed'] + stats['dropped'], 20)
+        # Os frames descartados são os atrasados: a ordem dos processados é preservada
+        indices = [int(frame[0, 0, 0]) for frame in received]
+        self.assertEqual(indices, sorted(indices))
+
+    def test_external_stop_returns(self):
+        processor = make_processor()
+        stop_event = threading.Event()
+        received = []
+
+        # Interrompe uma fonte infinita a partir de outra thread
+        timer = threading.Timer(0.2, stop_event.set)
+        timer.start()
+        try:
+            finished, stats = run_with_timeout(
+                processor.process_stream_realtime,
+                FakeCapture(total=None, delay=0.005),
+                received.append,
+                stop_event
+            )
+        finally:
+            timer.cancel()
+
+        self.assertTrue(finished, "process_stream_realtime não retornou após o stop_event")
+        self.assertGreater(stats['processed'], 0)
+        self.assertEqual(stats['processed'], len(received))
+
+
+class FailingWriter:
+    """
+    VideoWriter que falha ao escrever o frame de índice fail_at.
+    """
+
+    def __init__(self, fail_at):
+        self.fail_at = fail_at
+        self.written = 0
+
+    def write(self, frame):
+        if self.written == self.fail_at:
+            raise IOError("falha simulada de escrita")
+        self.written += 1
+
+    def release(self):
+        pass
+
+
+class ProcessVideoTest(unittest.TestCase):
+
+    frame_count = 24
+    frame_size = (64, 48)  # (largura, altura)
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.video_path = os.path.join(self.tmp_dir.name, 'clip.avi')
+        self.output_folder = os.path.join(self.tmp_dir.name, 'saida')
+
+        # Clipe gerado com frames de cor uniforme; a intensidade codifica o índice do frame
+        out = cv2.VideoWriter(self.video_path, cv2.VideoWriter_fourcc(*'MJPG'), 10, self.frame_size)
+        for index in range(self.frame_count):
+            out.write(np.full((self.frame_size[1], self.frame_size[0], 3), self.intensity(index), dtype=np.uint8))
+        out.release()
+
+    def intensity(self, index):
+        return 10 * index
+
+    def read_intensities(self, path):
+        cap = cv2.VideoCapture(path)
+        intensities = []
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            intensities.append(float(frame.mean()))
+        cap.release()
+        return intensities
+
+    def test_output_keeps_frame_count_and_order(self):
+        for prefetch in (1, 2, 8):
+            with self.subTest(prefetch=prefetch):
+                finished, result = run_with_timeout(
+                    make_processor().process_video, self.video_path, self.output_folder, prefetch=prefetch
+                )
+
+                self.assertTrue(finished, "process_video não retornou")
+                success, output_path = result
+                self.assertTrue(success, output_path)
+
+                # Compara com o clipe de entrada decodificado; metade do passo entre frames
+                # vizinhos absorve a compressão com perdas sem aceitar um frame trocado
+                expected = self.read_intensities(self.video_path)
+                intensities = self.read_intensities(output_path)
+                self.assertEqual(len(intensities), self.frame_count)
+                for index, value in enumerate(intensities):
+                    self.assertAlmostEqual(value, expected[index], delta=self.intensity(1) / 2)
+
+    def test_writer_failure_stops_both_threads(self):
+        original_writer = video_processor.cv2.VideoWriter
+        video_processor.cv2.VideoWriter = lambda *args, **kwargs: FailingWriter(fail_at=3)
+        self.addCleanup(setattr, video_processor.cv2, 'VideoWriter', original_writer)
+
+        threads_before = set(threading.enumerate())
+        finished, result = run_with_timeout(
+            make_processor().process_video, self.video_path, self.output_folder, prefetch=2
+        )
+
+        self.assertTrue(finished, "process_video não retornou após a falha de escrita")
+        success, message = result
+        self.assertFalse(success)
+        self.assertIn("falha simulada de escrita", message)
+
+        # As threads de leitura e escrita terminam junto com a chamada
+        leftover = [thread for thread in set(threading.enumerate()) - threads_before if thread.is_alive()]
+        self.assertEqual(leftover, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,316 @@
+"""
+Verificação de código inalcançável nos módulos de visualização.
+
+Percorre os blocos de cada função (incluindo blocos aninhados de if, for,
+while, try e with) e aponta qualquer instrução que apareça depois de um
+`return`, `raise`, `continue` ou `break` no mesmo bloco (ou depois de um
+`if`/`else` ou `try`/`except` em que todos os caminhos terminam). Um `return`
+idêntico logo após outro (sinal típico de erro de merge ou de código gerado)
+é inalcançável e aparece nesse relatório marcado como duplicado. Com a opção
+`--fix`, remove as instruções mortas do arquivo (por exemplo, uma sequência
+de `return frame` repetidos depois do primeiro).
+
+Também limita quantos `return` estruturalmente idênticos, no mesmo nível de
+indentação, uma função pode ter (`--max-identical-returns`, padrão 3). Esse
+problema não é corrigido automaticamente.
+
+Uso:
+    python tools/check_dead_returns.py [--fix] [--max-identical-returns N] [caminhos ...]
+
+Sem caminhos, verifica todos os arquivos de backend/modules/visualization.
+Retorna código de saída 1 se algum problema for encontrado (e não corrigido).
+"""
+import argparse
+import ast
+import os
+import sys
+
+# Pasta verificada por padrão
+DEFAULT_PATHS = [
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                 'backend', 'modules', 'visualization')
+]
+
+# Instruções que encerram incondicionalmente um bloco
+TERMINATOR_TYPES = (ast.Return, ast.Raise, ast.Continue, ast.Break)
+
+# Blocos try (inclusive try/except* a partir do Python 3.11)
+TRY_TYPES = (ast.Try, ast.TryStar) if hasattr(ast, 'TryStar') else (ast.Try,)
+
+# Quantidade padrão de `return` idênticos permitida por função (guardas de saída antecipada)
+DEFAULT_MAX_IDENTICAL_RETURNS = 3
+
+# Campos dos nós que contêm blocos de instruções
+BLOCK_FIELDS = ('body', 'orelse', 'finalbody')
+
+
+def _iter_blocks(node):
+    """
+    Lista os blocos de instruções de um nó (corpo, else e finally).
+
+    Args:
+        node (ast.AST): Nó da árvore sintática
+
+    Returns:
+        generator: Listas de instruções
+    """
+    for field in BLOCK_FIELDS:
+        block = getattr(node, field, None)
+        if isinstance(block, list) and block and isinstance(block[0], ast.stmt):
+            yield block
+
+
+def _block_terminates(block):
+    """
+    Indica se um bloco de instruções nunca termina normalmente.
+
+    Args:
+        block (list): Lista de instruções
+
+    Returns:
+        bool: True se alguma instrução do bloco é terminal
+    """
+    return any(_terminates(stmt) for stmt in block)
+
+
+def _terminates(stmt):
+    """
+    Indica se a execução nunca passa da instrução para a seguinte no mesmo bloco.
+
+    Além de `return`, `raise`, `continue` e `break`, um `if` cujos dois ramos
+    terminam e um `try` que termina em todos os caminhos (corpo ou else e todos
+    os handlers, ou então o finally) também são terminais. Laços e `with` não
+    são considerados: o laço pode não executar e o gerenciador de contexto pode
+    suprimir a exceção.
+
+    Args:
+        stmt (ast.stmt): Instrução a verificar
+
+    Returns:
+        bool: True se a instrução é terminal
+    """
+    if isinstance(stmt, TERMINATOR_TYPES):
+        return True
+
+    if isinstance(stmt, ast.If):
+        return bool(stmt.orelse) and _block_terminates(stmt.body) and _block_terminates(stmt.orelse)
+
+    if isinstance(stmt, TRY_TYPES):
+        if _block_terminates(stmt.finalbody):
+            return True
+        normal_path_terminates = _block_terminates(stmt.body) or _block_terminates(stmt.orelse)
+        return normal_path_terminates and all(_block_terminates(handler.body) for handler in stmt.handlers)
+
+    return False
+
+
+def find_dead_code(tree):
+    """
+    Encontra instruções inalcançáveis em qualquer bloco das funções.
+
+    Cada bloco é percorrido uma única vez: a primeira instrução terminal
+    (ver _terminates) encerra o bloco e as seguintes são inalcançáveis.
+
+    Args:
+        tree (ast.AST): Árvore sintática do módulo
+
+    Returns:
+        list: Lista de tuplas (função, instrução terminal, instruções mortas)
+    """
+    findings = []
+
+    def visit(node, func):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            func = node
+
+        if func is not None:
+            for block in _iter_blocks(node):
+                for index, stmt in enumerate(block):
+                    if _terminates(stmt):
+                        dead = block[index + 1:]
+                        if dead:
+                            findings.append((func, stmt, dead))
+                        break
+
+        for child in ast.iter_child_nodes(node):
+            visit(child, func)
+
+    visit(tree, None)
+    return findings
+
+
+def _dump(node):
+    """
+    Representação estrutural de um nó (ou None para `return` sem valor).
+    """
+    return ast.dump(node) if node is not None else None
+
+
+def _iter_function_returns(func):
+    """
+    Lista os `return` de uma função, sem entrar em funções aninhadas.
+
+    Args:
+        func (ast.FunctionDef): Função a percorrer
+
+    Returns:
+        generator: Nós `return` da função
+    """
+    pending = list(ast.iter_child_nodes(func))
+    while pending:
+        node = pending.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+            continue
+        if isinstance(node, ast.Return):
+            yield node
+        pending.extend(ast.iter_child_nodes(node))
+
+
+def find_repeated_returns(tree, limit):
+    """
+    Encontra funções com mais de `limit` returns idênticos no mesmo nível de indentação.
+
+    Args:
+        tree (ast.AST): Árvore sintática do módulo
+        limit (int): Quantidade máxima permitida de returns idênticos
+
+    Returns:
+        list: Lista de tuplas (função, returns idênticos em ordem de linha)
+    """
+    findings = []
+
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+
+        groups = {}
+        for stmt in _iter_function_returns(node):
+            groups.setdefault((stmt.col_offset, _dump(stmt.value)), []).append(stmt)
+
+        for returns in groups.values():
+            if len(returns) > limit:
+                findings.append((node, sorted(returns, key=lambda stmt: stmt.lineno)))
+
+    return findings
+
+
+def remove_lines(source, ranges):
+    """
+    Remove do código-fonte os intervalos de linhas informados.
+
+    Args:
+        source (str): Código-fonte original
+        ranges (list): Intervalos (início, fim) no formato de fatia, com índice 0
+
+    Returns:
+        str: Código-fonte sem as linhas removidas
+    """
+    lines = source.splitlines(keepends=True)
+
+    # Os intervalos podem se sobrepor (código morto dentro de um bloco que já é inalcançável)
+    removed = set()
+    for start, end in ranges:
+        removed.update(range(start, end))
+
+    return ''.join(line for index, line in enumerate(lines) if index not in removed)
+
+
+def iter_python_files(paths):
+    """
+    Lista os arquivos Python contidos nos caminhos informados.
+
+    Args:
+        paths (list): Arquivos ou pastas a verificar
+
+    Returns:
+        generator: Caminhos dos arquivos .py
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.endswith('.py'):
+                        yield os.path.join(root, name)
+        elif path.endswith('.py'):
+            yield path
+
+
+def check_file(path, fix=False, max_identical_returns=DEFAULT_MAX_IDENTICAL_RETURNS):
+    """
+    Verifica (e opcionalmente corrige) um arquivo.
+
+    Args:
+        path (str): Caminho do arquivo
+        fix (bool): Se True, remove as instruções inalcançáveis
+        max_identical_returns (int): Quantidade máxima de returns idênticos por função
+
+    Returns:
+        int: Número de problemas que permanecem no arquivo
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    tree = ast.parse(source, filename=path)
+    dead_code = find_dead_code(tree)
+
+    # Intervalos de linhas a remover, no formato de fatia (índice 0)
+    ranges = []
+
+    for func, terminator, dead in dead_code:
+        # Um return idêntico logo após o terminal indica um return duplicado
+        duplicate = (isinstance(terminator, ast.Return) and isinstance(dead[0], ast.Return)
+                     and _dump(terminator.value) == _dump(dead[0].value))
+        print(
+            f"{path}:{dead[0].lineno}: {len(dead)} instrução(ões) inalcançável(is) "
+            f"após '{type(terminator).__name__.lower()}' na linha {terminator.lineno} "
+            f"(função '{func.name}')" + (" — 'return' duplicado" if duplicate else "")
+        )
+        ranges.append((terminator.end_lineno, dead[-1].end_lineno))
+
+    problems = len(dead_code)
+
+    # Intervalos vazios ocorrem quando o código morto está na mesma linha da
+    # instrução terminal (por exemplo `continue; print(i)`) e não são corrigidos
+    ranges = [(start, end) for start, end in ranges if start < end]
+
+    if fix and ranges:
+        source = remove_lines(source, ranges)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+        print(f"{path}: código inalcançável removido")
+
+        # Conta o que ainda resta no código corrigido (a verificação de repetição também o considera)
+        tree = ast.parse(source, filename=path)
+        problems = len(find_dead_code(tree))
+        if problems:
+            print(f"{path}: {problems} problema(s) não puderam ser corrigidos automaticamente")
+
+    repeated = find_repeated_returns(tree, max_identical_returns)
+    for func, returns in repeated:
+        print(
+            f"{path}:{returns[0].lineno}: {len(returns)} 'return' idênticos na função '{func.name}' "
+            f"(máximo {max_identical_returns}; linhas {', '.join(str(stmt.lineno) for stmt in returns)})"
+        )
+
+    return problems + len(repeated)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Verifica código inalcançável após return/raise")
+    parser.add_argument('paths', nargs='*', help="Arquivos ou pastas a verificar")
+    parser.add_argument('--fix', action='store_true', help="Remove as instruções inalcançáveis")
+    parser.add_argument(
+        '--max-identical-returns', type=int, default=DEFAULT_MAX_IDENTICAL_RETURNS,
+        help="Quantidade máxima de returns idênticos no mesmo nível por função"
+    )
+    args = parser.parse_args(argv)
+
+    problems = 0
+    for path in iter_python_files(args.paths or DEFAULT_PATHS):
+        problems += check_file(path, fix=args.fix, max_identical_returns=args.max_identical_returns)
+
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())